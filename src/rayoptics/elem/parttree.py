@@ -10,7 +10,6 @@
 from itertools import zip_longest
 
 from anytree import Node, RenderTree, PreOrderIter
-from anytree.exporter import DictExporter
 from anytree.importer import DictImporter
 from anytree.search import find_by_attr
 
@@ -22,30 +21,35 @@ class PartTree():
     def __init__(self, opt_model, **kwargs):
         self.opt_model = opt_model
         self.root_node = Node('root', id=self, tag='#group#root')
+        self._id_index = {}
 
     def __json_encode__(self):
         attrs = dict(vars(self))
         del attrs['opt_model']
-
-        def node_attrs(attrs_):
-            attrs = []
-            for k, v in attrs_:
-                if k == "name" or k == "tag":
-                    attrs.append((k, v))
-                elif k == "id":
-                    attrs.append(("id_key", str(id(v))))
-            return attrs
-
-        exporter = DictExporter(attriter=node_attrs)
-        attrs['root_node'] = exporter.export(self.root_node)
+        attrs.pop('_id_index', None)
+
+        # the tree is saved as a flat list of nodes in preorder; each entry
+        #  is (parent_idx, name, tag, id_key), with a parent_idx of -1 for
+        #  the root node.
+        nodes = list(PreOrderIter(self.root_node))
+        node_idx = {id(n): i for i, n in enumerate(nodes)}
+        attrs['root_node'] = [
+            (node_idx.get(id(n.parent), -1), n.name, getattr(n, 'tag', None),
+             str(id(n.id)) if hasattr(n, 'id') else None)
+            for n in nodes]
         return attrs
 
     def sync_to_restore(self, opt_model):
         self.opt_model = opt_model
+        self._id_index = {}
         if hasattr(self, 'root_node'):
             root_node_compressed = self.root_node
-            importer = DictImporter()
-            self.root_node = importer.import_(root_node_compressed)
+            if isinstance(root_node_compressed, dict):
+                # nested dict format written by earlier versions
+                importer = DictImporter()
+                self.root_node = importer.import_(root_node_compressed)
+            else:
+                self.root_node = import_flat_tree(root_node_compressed)
             self.root_node.id = self
             if hasattr(self.root_node, 'id_key'):
                 sync_part_tree_on_restore_idkey(self.opt_model, 
@@ -77,9 +81,12 @@ class PartTree():
         for i, sgz in enumerate(zip_longest(seq_model.ifcs, seq_model.gaps,
                                             seq_model.z_dir)):
             s, gap, z_dir = sgz
-            Node(f'i{i}', id=s, tag='#ifc', parent=root_node)
+            self.register_node(
+                Node(f'i{i}', id=s, tag='#ifc', parent=root_node))
             if gap is not None:
-                Node(f'g{i}', id=(gap, z_dir), tag='#gap', parent=root_node)
+                self.register_node(
+                    Node(f'g{i}', id=(gap, z_dir), tag='#gap',
+                         parent=root_node))
 
     def sort_tree_using_sequence(self, seq_model):
         """Resequence part tree using a *seq_model*. """
@@ -134,11 +141,31 @@ class PartTree():
             if dup_node is not None:
                 dup_node.parent = None
         e_node.parent = self.root_node
+        for n in PreOrderIter(e_node):
+            self.register_node(n)
         return e_node
 
+    def register_node(self, node):
+        """ Add `node` to the index used by :meth:`node`. """
+        self._id_index[id_key(node.id)] = node
+
+    def rebuild_id_index(self):
+        """ Rebuild the index used by :meth:`node` from the tree. """
+        self._id_index = {}
+        for n in PreOrderIter(self.root_node):
+            if hasattr(n, 'id'):
+                self._id_index.setdefault(id_key(n.id), n)
+
     def node(self, obj):
         """ Return the node paired with `obj`. """
-        return find_by_attr(self.root_node, name='id', value=obj)
+        key = id_key(obj)
+        node = self._id_index.get(key)
+        if (node is None or node.root is not self.root_node or
+                id_key(node.id) != key):
+            # the tree may have been changed outside of the PartTree api
+            self.rebuild_id_index()
+            node = self._id_index.get(key)
+        return node
 
     def obj_by_name(self, name):
         """ Return the node paired with `obj`. """
@@ -235,6 +262,41 @@ class PartTree():
         self.list_tree(childiter=self.get_child_filter(tag=tag))
 
 
+def id_key(obj):
+    """ Return a hashable key for the identity of a node's `id` object.
+
+    Gap nodes are paired with a (gap, z_dir) tuple that is rebuilt on each
+    lookup, so the key for a tuple uses the identity of the gap.
+    """
+    if isinstance(obj, tuple):
+        return (id(obj[0]),) + obj[1:]
+    else:
+        return id(obj)
+
+
+def nodes_by_name(node):
+    """ Return a dict of `node` and its descendants, keyed by node name. """
+    name_dict = {}
+    for n in PreOrderIter(node):
+        name_dict.setdefault(n.name, n)
+    return name_dict
+
+
+def import_flat_tree(flat_tree):
+    """ Rebuild a node tree from the flat list written by __json_encode__. """
+    nodes = []
+    for parent_idx, name, tag, idkey in flat_tree:
+        node = Node(name)
+        if tag is not None:
+            node.tag = tag
+        if idkey is not None:
+            node.id_key = idkey
+        if parent_idx != -1:
+            node.parent = nodes[parent_idx]
+        nodes.append(node)
+    return nodes[0]
+
+
 def sync_part_tree_on_restore(opt_model, ele_model, seq_model, root_node):
     ele_dict = {e.label: e for e in ele_model.elements}
     for node in PreOrderIter(root_node):
@@ -301,14 +363,17 @@ def sync_part_tree_on_restore_idkey(opt_model, ele_model, seq_model, root_node):
 def sync_part_tree_on_update(ele_model, seq_model, root_node):
     """Update node names to track element labels. """
     ele_dict = {e.label: e for e in ele_model.elements}
+    # map interfaces and gaps to their sequence indices, keyed by identity
+    ifc_idx = {id(ifc): i for i, ifc in enumerate(seq_model.ifcs)}
+    gap_idx = {id(gap): i for i, gap in enumerate(seq_model.gaps)}
     for node in PreOrderIter(root_node):
         name = node.name
         if name[0] == 'i':
-            idx = seq_model.ifcs.index(node.id)
+            idx = ifc_idx[id(node.id)]
             node.name = f'i{idx}'
         elif name[0] == 'g':
             gap, z_dir = node.id
-            idx = seq_model.gaps.index(gap)
+            idx = gap_idx[id(gap)]
             z_dir = seq_model.z_dir[idx]
             node.id = (gap, z_dir)
             node.name = f'g{idx}'
@@ -323,7 +388,7 @@ def sync_part_tree_on_update(ele_model, seq_model, root_node):
             p_name = node.parent.name
             e = ele_dict[p_name]
             node.id = e.intrfc
-            idx = seq_model.ifcs.index(node.id)
+            idx = ifc_idx[id(node.id)]
             node.name = f'tl{idx}'
         elif name[0] == 't':
             p_name = node.parent.name
@@ -349,19 +414,23 @@ def elements_from_sequence(ele_model, seq_model, part_tree):
     g_tfrms = seq_model.compute_global_coords(1)
     buried_reflector = False
     eles = []
-    path = seq_model.path()
+    path = tuple(seq_model.path())
+    # classify the gap media once, process_airgap also needs them
+    is_air = [g is not None and g.medium.name().lower() == 'air'
+              for ifc, g, tfrm, rindx, z_dir in path]
+    parent_node = part_tree.parent_node
     for i, seg in enumerate(path):
         ifc, g, tfrm, rindx, z_dir = seg
-        if part_tree.parent_node(ifc) is None:
+        if parent_node(ifc) is None:
             g_tfrm = g_tfrms[i]
     
             if g is not None:
-                if g.medium.name().lower() == 'air':
+                if is_air[i]:
                     num_eles = len(eles)
                     if num_eles == 0:
                         process_airgap(
                             ele_model, seq_model, part_tree,
-                            i, g, z_dir, ifc, g_tfrm, add_ele=True)
+                            i, g, z_dir, ifc, g_tfrm, is_air, add_ele=True)
                     else:
                         if buried_reflector is True:
                             num_eles = num_eles//2
@@ -379,8 +448,7 @@ def elements_from_sequence(ele_model, seq_model, part_tree):
                             if buried_reflector is True:
                                 ifc2 = eles[-1][1]
                                 ifc_node = part_tree.node(ifc2)
-                                p_node = find_by_attr(e_node, name='name',
-                                                      value='p1')
+                                p_node = nodes_by_name(e_node).get('p1')
                                 ifc_node.parent = p_node
     
                                 g1_node = part_tree.node((g1, z_dir1))
@@ -398,22 +466,17 @@ def elements_from_sequence(ele_model, seq_model, part_tree):
                             e_node = part_tree.add_element_to_tree(e, z_dir=z_dir)
                             ele_model.add_element(e)
                             if buried_reflector is True:
+                                e_nodes = nodes_by_name(e_node)
                                 for i, j in enumerate(range(-1, -num_eles-1, -1),
                                                       start=1):
                                     ifc = eles[j][1]
                                     ifc_node = part_tree.node(ifc)
-                                    pid = f'p{i}'
-                                    p_node = find_by_attr(e_node,
-                                                          name='name',
-                                                          value=pid)
+                                    p_node = e_nodes.get(f'p{i}')
                                     ifc_node.parent = p_node
                                     g = eles[j-1][2]
                                     z_dir = eles[j-1][3]
                                     g_node = part_tree.node((g, z_dir))
-                                    tid = f't{i}'
-                                    t_node = find_by_attr(e_node,
-                                                          name='name',
-                                                          value=tid)
+                                    t_node = e_nodes.get(f't{i}')
                                     if g_node:
                                         g_node.parent = t_node
                             # set up for airgap
@@ -436,7 +499,7 @@ def elements_from_sequence(ele_model, seq_model, part_tree):
                     eles.append((i, ifc, g, z_dir, g_tfrm))
             else:
                 process_airgap(ele_model, seq_model, part_tree,
-                               i, g, z_dir, ifc, g_tfrm)
+                               i, g, z_dir, ifc, g_tfrm, is_air)
 
     # rename and tag the Image space airgap
     node = part_tree.parent_node((seq_model.gaps[-1], seq_model.z_dir[-1]))
@@ -449,7 +512,7 @@ def elements_from_sequence(ele_model, seq_model, part_tree):
 
 
 def process_airgap(ele_model, seq_model, part_tree, i, g, z_dir, s, g_tfrm,
-                   add_ele=True):
+                   is_air, add_ele=True):
     if s.interact_mode == 'reflect' and add_ele:
         sd = s.surface_od()
         z_dir = seq_model.z_dir[i]
@@ -473,8 +536,7 @@ def process_airgap(ele_model, seq_model, part_tree, i, g, z_dir, s, g_tfrm,
             dummy_label = 'Image'
             dummy_tag = '#image'
         else:  # i > 0
-            gp = seq_model.gaps[i-1]
-            if gp.medium.name().lower() == 'air':
+            if is_air[i-1]:
                 add_dummy = True
                 if seq_model.stop_surface == i:
                     dummy_label = 'Stop'
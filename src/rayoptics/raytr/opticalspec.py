@@ -39,6 +39,13 @@ class OpticalSpecs:
 
     Attributes:
         do_aiming: if True, iterate chief rays to stop center, else entrance pupil
+        fod: the :class:`~.FirstOrderData` of the current paraxial data
+        enp_radius: entrance pupil radius
+        enp_plane_dist: distance from the object to the entrance pupil plane
+        red: reduction ratio
+
+    The first order values are copied from **fod** when the optical
+    properties are updated, so the ray trace setup can read them directly.
 
     """
 
@@ -68,6 +75,8 @@ class OpticalSpecs:
         del attrs['opt_model']
         del attrs['_submodels']
         del attrs['do_aiming']
+        for fod_attr in ['fod', 'enp_radius', 'enp_plane_dist', 'red']:
+            attrs.pop(fod_attr, None)
 
         attrs['spectral_region'] = self['wvls']
         attrs['pupil'] = self['pupil']
@@ -154,8 +163,14 @@ class OpticalSpecs:
         if self.opt_model.seq_model.get_num_surfaces() > 2:
             stop = self.opt_model.seq_model.stop_surface
             wvl = self.spectral_region.central_wvl
-            self.opt_model['analysis_results']['parax_data'] = \
-                compute_first_order(self.opt_model, stop, wvl)
+            parax_data = compute_first_order(self.opt_model, stop, wvl)
+            self.opt_model['analysis_results']['parax_data'] = parax_data
+
+            fod = parax_data.fod
+            self.fod = fod
+            self.enp_radius = fod.enp_radius
+            self.enp_plane_dist = fod.obj_dist + fod.enp_dist
+            self.red = fod.red
 
             if self.do_aiming:
                 for i, fld in enumerate(self.field_of_view.fields):
@@ -213,6 +228,11 @@ class WvlSpec:
         self.reference_wvl = ref_wl
         self.coating_wvl = 550.0
 
+    def __json_encode__(self):
+        attrs = dict(vars(self))
+        attrs.pop('_colors_key', None)
+        return attrs
+
     def listobj_str(self):
         wvls = self.wavelengths
         ref_wvl = self.reference_wvl
@@ -265,6 +285,12 @@ class WvlSpec:
         self.spectral_wts = spectrumT[1]
         
     def calc_colors(self):
+        # the colors depend only on the wavelengths, skip if unchanged
+        colors_key = tuple(self.wavelengths)
+        if (getattr(self, '_colors_key', None) == colors_key and
+                hasattr(self, 'render_colors')):
+            return
+
         accent = colors.accent_colors()
         self.render_colors = []
         num_wvls = len(self.wavelengths)
@@ -282,16 +308,17 @@ class WvlSpec:
                 c = ['violet', 'cyan', 'green', 'yellow', 'red']
             elif num_wvls == 6:
                 c = ['violet', 'cyan', 'green', 'yellow', 'red', 'magenta']
-            else:
+            elif num_wvls == 7:
                 c = ['violet', 'blue', 'cyan', 'green', 'yellow',
                      'red', 'magenta']
+            else:
+                # more wavelengths than accent colors, use spectral colors
+                rgbs = srgb.wvls_to_rgb(self.wavelengths)
+                self.render_colors = [srgb.rgb_to_hex(rgb) for rgb in rgbs]
+                self._colors_key = colors_key
+                return
             self.render_colors = [accent[clr] for clr in c[::step]]
-        # else:
-        #     for w in self.wavelengths:
-        #         print("calc_colors", w)
-        #         rgb = srgb.wvl_to_rgb(w)
-        #         print("rgb", rgb)
-        #         self.render_colors.append(rgb)
+        self._colors_key = colors_key
 
 
 class PupilSpec:
@@ -472,24 +499,25 @@ class FieldSpec:
         self.key = fld_key
 
     def obj_coords(self, fld):
-        fld_coord = np.array([fld.x, fld.y, 0.0])
+        osp = self.optical_spec
+        fod = osp.fod
+        # the object point is reused until the field or the first order
+        #  data, which is recomputed as a new instance, changes
+        fld_key = fld.x, fld.y, self.key, self.value, self.is_relative
+        obj_pt_cache = getattr(fld, 'obj_pt_cache', None)
+        if (obj_pt_cache is not None and obj_pt_cache[0] is fod and
+                obj_pt_cache[1] == fld_key):
+            return obj_pt_cache[2].copy()
+
+        fld_x, fld_y = fld.x, fld.y
         if self.is_relative:
-            fld_coord *= self.value
+            fld_x *= self.value
+            fld_y *= self.value
 
         field, obj_img_key, value_key = self.key
-
-        fod = self.optical_spec.opt_model['ar']['parax_data'].fod
-        if obj_img_key == 'object':
-            if value_key == 'angle':
-                dir_tan = np.tan(np.deg2rad(fld_coord))
-                obj_pt = -dir_tan*(fod.obj_dist+fod.enp_dist)
-            elif value_key == 'height':
-                obj_pt = fld_coord
-        elif obj_img_key == 'image':
-            if value_key == 'height':
-                img_pt = fld_coord
-                obj_pt = fod.red*img_pt
-        return obj_pt
+        obj_pt = obj_coords_by_key[obj_img_key, value_key](fld_x, fld_y, osp)
+        fld.obj_pt_cache = fod, fld_key, obj_pt
+        return obj_pt.copy()
 
     def max_field(self):
         """ calculates the maximum field of view
@@ -497,19 +525,47 @@ class FieldSpec:
         Returns:
             magnitude of maximum field, maximum Field instance
         """
-        max_fld = None
-        max_fld_sqrd = -1.0
-        for i, f in enumerate(self.fields):
-            fld_sqrd = f.x*f.x + f.y*f.y
-            if fld_sqrd > max_fld_sqrd:
-                max_fld_sqrd = fld_sqrd
-                max_fld = i
-        max_fld_value = math.sqrt(max_fld_sqrd)
+        num_flds = len(self.fields)
+        xs = np.fromiter((f.x for f in self.fields), dtype=np.float64,
+                         count=num_flds)
+        ys = np.fromiter((f.y for f in self.fields), dtype=np.float64,
+                         count=num_flds)
+        fld_sqrd = xs*xs + ys*ys
+        max_fld = int(fld_sqrd.argmax())
+        max_fld_value = math.sqrt(fld_sqrd[max_fld])
         if self.is_relative:
             max_fld_value *= self.value
         return max_fld_value, max_fld
 
 
+def obj_coords_object_angle(fld_x, fld_y, osp):
+    """ object point for a field given as an object space angle """
+    dist = osp.enp_plane_dist
+    return np.array([-math.tan(math.radians(fld_x))*dist,
+                     -math.tan(math.radians(fld_y))*dist,
+                     0.0])
+
+
+def obj_coords_object_height(fld_x, fld_y, osp):
+    """ object point for a field given as an object height """
+    return np.array([fld_x, fld_y, 0.0])
+
+
+def obj_coords_image_height(fld_x, fld_y, osp):
+    """ object point for a field given as a paraxial image height """
+    red = osp.red
+    return np.array([red*fld_x, red*fld_y, 0.0])
+
+
+# FieldSpec.obj_coords dispatch, keyed on the (obj_img_key, value_key)
+#  part of the FieldSpec key
+obj_coords_by_key = {
+    ('object', 'angle'): obj_coords_object_angle,
+    ('object', 'height'): obj_coords_object_height,
+    ('image', 'height'): obj_coords_image_height,
+    }
+
+
 class Field:
     """ a single field point, largely a data container
 
@@ -526,6 +582,8 @@ class Field:
                    center of the aperture stop, traced in the central
                    wavelength
         ref_sphere: a tuple containing (image_pt, ref_dir, ref_sphere_radius)
+        obj_pt_cache: the first order data, field inputs and object point of
+                      the last call to :meth:`FieldSpec.obj_coords`
 
     """
 
@@ -540,10 +598,11 @@ class Field:
         self.aim_pt = None
         self.chief_ray = None
         self.ref_sphere = None
+        self.obj_pt_cache = None
 
     def __json_encode__(self):
         attrs = dict(vars(self))
-        items = ['chief_ray', 'ref_sphere', 'pupil_rays']
+        items = ['chief_ray', 'ref_sphere', 'pupil_rays', 'obj_pt_cache']
         for item in items:
             if item in attrs:
                 del attrs[item]
@@ -577,6 +636,7 @@ class Field:
     def update(self):
         self.chief_ray = None
         self.ref_sphere = None
+        self.obj_pt_cache = None
         
     def vignetting_bbox(self, pupil_spec: PupilSpec, oversize=1.02):
         """ returns a bbox of the vignetted pupil ray extents. """
@@ -588,21 +648,19 @@ class Field:
         return vig_bbox
 
     def apply_vignetting(self, pupil):
+        # a zero vignetting factor scales by exactly 1.0, no test needed
         vig_pupil = pupil[:]
-        if pupil[0] < 0.0:
-            if self.vlx != 0.0:
-                vig_pupil[0] *= (1.0 - self.vlx)
-        else:
-            if self.vux != 0.0:
-                vig_pupil[0] *= (1.0 - self.vux)
-        if pupil[1] < 0.0:
-            if self.vly != 0.0:
-                vig_pupil[1] *= (1.0 - self.vly)
-        else:
-            if self.vuy != 0.0:
-                vig_pupil[1] *= (1.0 - self.vuy)
+        vig_pupil[0] *= 1.0 - (self.vlx if pupil[0] < 0.0 else self.vux)
+        vig_pupil[1] *= 1.0 - (self.vly if pupil[1] < 0.0 else self.vuy)
         return vig_pupil
 
+    def apply_vignetting_batch(self, pupils):
+        """ returns an array of vignetted pupils, `pupils` has shape (N, 2) """
+        pupils = np.asarray(pupils, dtype=float)
+        vig_lower = np.array([1.0 - self.vlx, 1.0 - self.vly])
+        vig_upper = np.array([1.0 - self.vux, 1.0 - self.vuy])
+        return pupils * np.where(pupils < 0.0, vig_lower, vig_upper)
+
 
 class FocusRange:
     """ Focus range specification
@@ -8,12 +8,13 @@
 .. codeauthor: Michael J. Hayford
 """
 
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from numpy.linalg import norm
 from math import sqrt, copysign
 
 import rayoptics.optical.model_constants as mc
-from .traceerror import (TraceMissedSurfaceError, TraceTIRError,
+from .traceerror import (TraceError, TraceMissedSurfaceError, TraceTIRError,
                          TraceRayBlockedError, TraceEvanescentRayError)
 
 def bend(d_in, normal, n_in, n_out):
@@ -81,6 +82,50 @@ def trace(seq_model, pt0, dir0, wvl, **kwargs):
     return trace_raw(path, pt0, dir0, wvl, **kwargs)
 
 
+def trace_bundle(seq_model, pt0, dirs, wvl, return_errors=False,
+                 n_workers=None, **kwargs):
+    """ trace a bundle of rays from a common starting point
+
+    The path through **seq_model** is built once and shared by all of the
+    rays in the bundle.
+
+    Args:
+        seq_model: the sequential model to be traced
+        pt0: starting point in coords of first interface
+        dirs: array of starting direction cosines, shape (N, 3), in coords of
+              first interface
+        wvl: wavelength in nm
+        return_errors: if True, the TraceError of a failed ray is returned in
+                       place of its ray package, otherwise it is raised
+        n_workers: if greater than 1, trace the rays on a pool of this many
+                   threads. The ray trace is mostly Python code, so this
+                   only pays off on an interpreter that runs threads in
+                   parallel (i.e. a free-threaded build).
+        eps: accuracy tolerance for surface intersection calculation
+
+    Returns:
+        a list of (**ray**, **op_delta**, **wvl**) for each ray in **dirs**.
+        See :func:`trace` for details.
+    """
+    path = list(seq_model.path(wvl))
+    kwargs['first_surf'] = kwargs.get('first_surf', 1)
+    kwargs['last_surf'] = kwargs.get('last_surf',
+                                     seq_model.get_num_surfaces()-2)
+
+    def trace_dir(dir0):
+        try:
+            return trace_raw(iter(path), pt0, dir0, wvl, **kwargs)
+        except TraceError as ray_error:
+            if not return_errors:
+                raise
+            return ray_error
+
+    if n_workers is not None and n_workers > 1:
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            return list(executor.map(trace_dir, dirs))
+    return [trace_dir(dir0) for dir0 in dirs]
+
+
 def trace_raw(path, pt0, dir0, wvl, eps=1.0e-12, check_apertures=False, **kwargs):
     """ fundamental raytrace function
 
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+""" tests for optical specification classes
+
+.. codeauthor: Michael J. Hayford
+"""
+
+import unittest
+from pathlib import Path
+import numpy as np
+import numpy.testing as npt
+
+import rayoptics as ro
+from rayoptics.gui.appcmds import open_model
+from rayoptics.raytr.opticalspec import Field, WvlSpec
+
+
+class FieldSpecTestCase(unittest.TestCase):
+    def setUp(self):
+        root_pth = Path(ro.__file__).resolve().parent
+        self.opm = open_model(root_pth/"codev/tests/ag_dblgauss.seq")
+        self.osp = self.opm.optical_spec
+
+    def test_obj_coords(self):
+        osp = self.osp
+        fod = self.opm['ar']['parax_data'].fod
+        fld = Field()
+        for y in (0., 10., 20.):
+            fld.y = y
+            obj_pt = osp.obj_coords(fld)
+            y_truth = -np.tan(np.deg2rad(y))*(fod.obj_dist + fod.enp_dist)
+            npt.assert_allclose(obj_pt, [0., y_truth, 0.], atol=1e-10)
+
+        # the returned point may be modified without affecting later calls
+        obj_pt[1] = 0.
+        npt.assert_allclose(osp.obj_coords(fld)[1], y_truth, atol=1e-10)
+
+    def test_obj_coords_after_update(self):
+        fld = self.osp.field_of_view.fields[-1]
+        obj_pt = self.osp.obj_coords(fld)
+        self.opm.seq_model.gaps[0].thi *= 2
+        self.opm.update_model()
+        self.assertNotEqual(self.osp.obj_coords(fld)[1], obj_pt[1])
+
+
+class WvlSpecTestCase(unittest.TestCase):
+    def test_render_colors_many_wavelengths(self):
+        wvls = np.linspace(420., 680., 9)
+        wvl_spec = WvlSpec([(w, 1.0) for w in wvls], ref_wl=4)
+        self.assertEqual(len(wvl_spec.render_colors), len(wvls))
+
+        # the spectral colors go from blue to red
+        blue = int(wvl_spec.render_colors[0][5:7], 16)
+        red = int(wvl_spec.render_colors[-1][1:3], 16)
+        self.assertEqual(blue, 255)
+        self.assertEqual(red, 255)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+""" tests for tracing fans of rays
+
+.. codeauthor: Michael J. Hayford
+"""
+
+import unittest
+from pathlib import Path
+import numpy as np
+import numpy.testing as npt
+
+import rayoptics as ro
+from rayoptics.gui.appcmds import open_model
+from rayoptics.raytr import trace
+
+
+class TraceFanTestCase(unittest.TestCase):
+    def setUp(self):
+        root_pth = Path(ro.__file__).resolve().parent
+        self.opm = open_model(root_pth/"codev/tests/ag_dblgauss.seq")
+
+    def test_trace_fan_matches_trace_base(self):
+        osp = self.opm.optical_spec
+        # the edge field has nonzero vignetting factors
+        fld, wvl, foc = osp.lookup_fld_wvl_focus(2)
+        fan_def = [np.array([0., -1.]), np.array([0., 1.]), 11]
+        fan = trace.trace_fan(self.opm, fan_def, fld, wvl, foc)
+        self.assertEqual(len(fan), 11)
+
+        for i, (vig_pupil, ray_pkg) in enumerate(fan):
+            pupil = [0., -1. + 0.2*i]
+            npt.assert_allclose(vig_pupil, fld.apply_vignetting(pupil),
+                                rtol=1e-12, atol=1e-14)
+            ray, op, wv = trace.trace_base(self.opm, pupil, fld, wvl)
+            self.assertEqual(wv, ray_pkg[2])
+            npt.assert_allclose(ray_pkg[1], op, rtol=1e-10, atol=1e-12)
+            for seg, seg_truth in zip(ray_pkg[0], ray):
+                npt.assert_allclose(seg[0], seg_truth[0],
+                                    rtol=1e-10, atol=1e-12)
+                npt.assert_allclose(seg[1], seg_truth[1],
+                                    rtol=1e-10, atol=1e-12)
+
+    def test_trace_fan_n_workers(self):
+        osp = self.opm.optical_spec
+        fld, wvl, foc = osp.lookup_fld_wvl_focus(1)
+        fan_def = [np.array([-1., 0.]), np.array([1., 0.]), 9]
+        fan = trace.trace_fan(self.opm, fan_def, fld, wvl, foc)
+        fan_mt = trace.trace_fan(self.opm, fan_def, fld, wvl, foc,
+                                 n_workers=3)
+        self.assertEqual(len(fan_mt), len(fan))
+        for (pupil, ray_pkg), (pupil_mt, ray_pkg_mt) in zip(fan, fan_mt):
+            npt.assert_array_equal(pupil_mt, pupil)
+            self.assertEqual(ray_pkg_mt[1], ray_pkg[1])
+            npt.assert_array_equal(ray_pkg_mt[0][-1][0], ray_pkg[0][-1][0])
+
+    def test_apply_vignetting_batch(self):
+        fld = self.opm.optical_spec.field_of_view.fields[2]
+        pupils = np.array([[-1., -1.], [1., 1.], [0., 0.], [-0.5, 0.5]])
+        vig_pupils = fld.apply_vignetting_batch(pupils)
+        for pupil, vig_pupil in zip(pupils, vig_pupils):
+            npt.assert_array_equal(vig_pupil,
+                                   fld.apply_vignetting(list(pupil)))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -11,6 +11,7 @@
 import itertools
 import warnings
 import math
+from math import sqrt
 import numpy as np
 from numpy.linalg import norm
 from scipy.optimize import newton, fsolve
@@ -171,6 +172,20 @@ def trace(seq_model, pt0, dir0, wvl, **kwargs):
     return rt.trace(seq_model, pt0, dir0, wvl, **kwargs)
 
 
+def direction_cosines(pt0, x1, y1, z1):
+    """ returns the direction cosines from pt0 towards the point (x1, y1, z1)
+
+    This is called for every ray traced, so the arithmetic is done on
+    Python floats; the numpy overhead dominates for 3 element vectors.
+    """
+    x0, y0, z0 = pt0.tolist()
+    dx = x1 - x0
+    dy = y1 - y0
+    dz = z1 - z0
+    length = sqrt(dx*dx + dy*dy + dz*dz)
+    return np.array([dx/length, dy/length, dz/length])
+
+
 def trace_base(opt_model, pupil, fld, wvl, apply_vignetting=True, **kwargs):
     """Trace ray specified by relative aperture and field point.
 
@@ -199,17 +214,14 @@ def trace_base(opt_model, pupil, fld, wvl, apply_vignetting=True, **kwargs):
     """
     vig_pupil = fld.apply_vignetting(pupil) if apply_vignetting else pupil
     osp = opt_model.optical_spec
-    fod = opt_model['analysis_results']['parax_data'].fod
-    eprad = fod.enp_radius
+    eprad = osp.enp_radius
     aim_pt = np.array([0., 0.])
     if hasattr(fld, 'aim_pt') and fld.aim_pt is not None:
         aim_pt = fld.aim_pt
-    pt1 = np.array([eprad*vig_pupil[0]+aim_pt[0], eprad*vig_pupil[1]+aim_pt[1],
-                    fod.obj_dist+fod.enp_dist])
     pt0 = osp.obj_coords(fld)
-    dir0 = pt1 - pt0
-    length = norm(dir0)
-    dir0 = dir0/length
+    dir0 = direction_cosines(pt0, eprad*vig_pupil[0]+aim_pt[0],
+                             eprad*vig_pupil[1]+aim_pt[1],
+                             osp.enp_plane_dist)
     sm = opt_model.seq_model
     # To handle virtual object distances, always propagate from 
     #  the object in a positive Z direction.
@@ -218,6 +230,46 @@ def trace_base(opt_model, pupil, fld, wvl, apply_vignetting=True, **kwargs):
     return rt.trace(sm, pt0, dir0, wvl, **kwargs)
 
 
+def setup_ray_bundle(opt_model, pupils, fld, apply_vignetting=True):
+    """Starting point and directions for a bundle of rays from field **fld**.
+
+    Args:
+        opt_model: instance of :class:`~.OpticalModel` to trace
+        pupils: array of relative pupil coordinates, shape (N, 2)
+        fld: instance of :class:`~.Field`
+        apply_vignetting: whether to apply vignetting factors to pupils
+
+    Returns:
+        (**vig_pupils**, **pt0**, **dirs**)
+
+        - **vig_pupils** - the (vignetted) pupil coordinates, shape (N, 2)
+        - **pt0** - the starting point on the object interface
+        - **dirs** - starting direction cosines, shape (N, 3)
+    """
+    pupils = np.asarray(pupils, dtype=float)
+    vig_pupils = (fld.apply_vignetting_batch(pupils) if apply_vignetting
+                  else pupils)
+    osp = opt_model.optical_spec
+    eprad = osp.enp_radius
+    aim_pt = np.array([0., 0.])
+    if hasattr(fld, 'aim_pt') and fld.aim_pt is not None:
+        aim_pt = fld.aim_pt
+    pt0 = osp.obj_coords(fld)
+    # fill a single buffer with the points on the entrance pupil plane and
+    #  convert them in place to direction cosines
+    dirs = np.empty((len(vig_pupils), 3))
+    np.multiply(vig_pupils, eprad, out=dirs[:, :2])
+    dirs[:, :2] += aim_pt
+    dirs[:, 2] = osp.enp_plane_dist
+    dirs -= pt0
+    dirs /= norm(dirs, axis=1, keepdims=True)
+    # To handle virtual object distances, always propagate from
+    #  the object in a positive Z direction.
+    is_reversed = dirs[:, 2:] * opt_model.seq_model.z_dir[0] < 0
+    np.negative(dirs, out=dirs, where=is_reversed)
+    return vig_pupils, pt0, dirs
+
+
 def iterate_ray(opt_model, ifcx, xy_target, fld, wvl, **kwargs):
     """ iterates a ray to xy_target on interface ifcx, returns aim points on
     the paraxial entrance pupil plane
@@ -228,10 +280,7 @@ def iterate_ray(opt_model, ifcx, xy_target, fld, wvl, **kwargs):
     """
     def y_stop_coordinate(y1, *args):
         seq_model, ifcx, pt0, dist, wvl, y_target = args
-        pt1 = np.array([0., y1, dist])
-        dir0 = pt1 - pt0
-        length = norm(dir0)
-        dir0 = dir0/length
+        dir0 = direction_cosines(pt0, 0., y1, dist)
         if dir0[2] * seq_model.z_dir[0] < 0:
             dir0 = -dir0
 
@@ -251,10 +300,7 @@ def iterate_ray(opt_model, ifcx, xy_target, fld, wvl, **kwargs):
 
     def surface_coordinate(coord, *args):
         seq_model, ifcx, pt0, dist, wvl, target = args
-        pt1 = np.array([coord[0], coord[1], dist])
-        dir0 = pt1 - pt0
-        length = norm(dir0)
-        dir0 = dir0/length
+        dir0 = direction_cosines(pt0, coord[0], coord[1], dist)
         if dir0[2] * seq_model.z_dir[0] < 0:
             dir0 = -dir0
         ray, _, _ = rt.trace(seq_model, pt0, dir0, wvl)
@@ -265,8 +311,7 @@ def iterate_ray(opt_model, ifcx, xy_target, fld, wvl, **kwargs):
     seq_model = opt_model.seq_model
     osp = opt_model.optical_spec
 
-    fod = opt_model['analysis_results']['parax_data'].fod
-    dist = fod.obj_dist + fod.enp_dist
+    dist = osp.enp_plane_dist
 
     pt0 = osp.obj_coords(fld)
     with warnings.catch_warnings():
@@ -292,7 +337,7 @@ def iterate_ray(opt_model, ifcx, xy_target, fld, wvl, **kwargs):
                 #  make proportional to pupil radius
                 try:
                     start_coords = fsolve(surface_coordinate, np.array([0., 0.]),
-                                        epsfcn=0.0001*fod.enp_radius,
+                                        epsfcn=0.0001*osp.enp_radius,
                                         args=(seq_model, ifcx, pt0, dist,
                                                 wvl, xy_target))
                 except TraceError:
@@ -332,11 +377,15 @@ def trace_boundary_rays_at_field(opt_model, fld, wvl, use_named_tuples=False):
     """
     rim_rays = []
     osp = opt_model.optical_spec
-    for p in osp.pupil.pupil_rays:
-        try:
-            ray, op, wvl = trace_base(opt_model, p, fld, wvl)
-        except TraceError as ray_error:
-            ray, op, wvl = ray_error.ray_pkg
+    vig_pupils, pt0, dirs = setup_ray_bundle(opt_model, osp.pupil.pupil_rays,
+                                             fld)
+    ray_pkgs = rt.trace_bundle(opt_model.seq_model, pt0, dirs, wvl,
+                               return_errors=True)
+    for ray_pkg in ray_pkgs:
+        if isinstance(ray_pkg, TraceError):
+            ray, op, wvl = ray_pkg.ray_pkg
+        else:
+            ray, op, wvl = ray_pkg
 
         if use_named_tuples:
             ray = [RaySeg(*rs) for rs in ray]
@@ -418,20 +467,20 @@ def trace_fan(opt_model, fan_rng, fld, wvl, foc, img_filter=None,
     stop = fan_rng[1]
     num = fan_rng[2]
     step = (stop - start)/(num - 1)
-    fan = []
-    for r in range(num):
-        pupil = np.array(start)
-        ray, op, wvl = trace_base(opt_model, pupil, fld, wvl, **kwargs)
-        # opl = rt.calc_optical_path(ray, opt_model.seq_model.path())
-        ray_pkg = ray, op, wvl
+    pupils = start + np.arange(num)[:, np.newaxis]*step
 
+    apply_vignetting = kwargs.pop('apply_vignetting', True)
+    vig_pupils, pt0, dirs = setup_ray_bundle(opt_model, pupils, fld,
+                                             apply_vignetting)
+    ray_pkgs = rt.trace_bundle(opt_model.seq_model, pt0, dirs, wvl, **kwargs)
+
+    fan = []
+    for pupil, ray_pkg in zip(vig_pupils, ray_pkgs):
         if img_filter:
             result = img_filter(pupil, ray_pkg)
             fan.append([pupil, result])
         else:
             fan.append([pupil, ray_pkg])
-
-        start += step
     return fan
 
 
@@ -439,10 +488,18 @@ def trace_grid(opt_model, grid_rng, fld, wvl, foc, img_filter=None,
                form='grid', append_if_none=True, **kwargs):
     output_filter = kwargs.get('output_filter', None)
     rayerr_filter = kwargs.get('rayerr_filter', None)
+    apply_vignetting = kwargs.pop('apply_vignetting', True)
     start = np.array(grid_rng[0])
     stop = grid_rng[1]
     num = grid_rng[2]
     step = np.array((stop - start)/(num - 1))
+    # lay out the pupil grid and vignette it once, ahead of the trace
+    steps = np.arange(num)
+    pupils = np.empty((num, num, 2))
+    pupils[:, :, 0] = (start[0] + steps*step[0])[:, np.newaxis]
+    pupils[:, :, 1] = start[1] + steps*step[1]
+    if apply_vignetting:
+        pupils = fld.apply_vignetting_batch(pupils)
     grid = []
     for i in range(num):
         if form == 'list':
@@ -452,9 +509,10 @@ def trace_grid(opt_model, grid_rng, fld, wvl, foc, img_filter=None,
             working_grid = grid_row
 
         for j in range(num):
-            pupil = np.array(start)
+            pupil = pupils[i, j]
             ray_result = trace_safe(opt_model, pupil, fld, wvl, 
                                     output_filter, rayerr_filter, 
+                                    apply_vignetting=False,
                                     check_apertures=True, **kwargs)
             if ray_result is not None:
                 if img_filter:
@@ -471,11 +529,8 @@ def trace_grid(opt_model, grid_rng, fld, wvl, foc, img_filter=None,
                     if append_if_none:
                         working_grid.append([pupil[0], pupil[1], None])
 
-            start[1] += step[1]
         if form == 'grid':
             grid.append(grid_row)
-        start[0] += step[0]
-        start[1] = grid_rng[0][1]
     return np.array(grid)
 
 
@@ -89,6 +89,9 @@ class SequentialModel:
         self.wvlns = []  # sampling wavelengths in nm
         self.rndx = []  # refractive index vs wv and gap
 
+        # full length paths, keyed by wavelength index
+        self._path_cache = {}
+
         if do_init:
             self._initialize_arrays()
 
@@ -99,6 +102,7 @@ class SequentialModel:
         del attrs['lcl_tfrms']
         del attrs['wvlns']
         del attrs['rndx']
+        attrs.pop('_path_cache', None)
         return attrs
 
     def _initialize_arrays(self):
@@ -150,6 +154,18 @@ class SequentialModel:
             gap_start = start
 
         wl_idx = self.index_for_wavelength(wl)
+
+        # the full path is reused until the model is updated or edited
+        is_full_path = start is None and stop is None and step == 1
+        if is_full_path:
+            path_cache = getattr(self, '_path_cache', None)
+            if path_cache is None:
+                path_cache = self._path_cache = {}
+            cached = path_cache.get(wl_idx)
+            if (cached is not None and cached[0] is self.lcl_tfrms and
+                    cached[1] is self.rndx):
+                return iter(cached[2])
+
         try:
             rndx = [n[wl_idx] for n in self.rndx[start:stop:step]]
         except IndexError:
@@ -162,6 +178,10 @@ class SequentialModel:
                                      self.lcl_tfrms[start:stop:step],
                                      rndx,
                                      self.z_dir[start:stop:step])
+        if is_full_path:
+            path = tuple(path)
+            path_cache[wl_idx] = self.lcl_tfrms, self.rndx, path
+            return iter(path)
         return path
 
     def reverse_path(self, wl=None, start=None, stop=None, step=-1):
@@ -270,6 +290,7 @@ class SequentialModel:
                     self.stop_surface += 1
         idx = self.cur_surface = (0 if self.cur_surface is None
                                    else self.cur_surface+1)
+        self._path_cache = {}
         self.ifcs.insert(idx, ifc)
         if gap is not None:
             idx_g = idx-1 if prev else idx
@@ -327,6 +348,7 @@ class SequentialModel:
         pt.trim_node(self.ifcs[idx])
 
         # interface related attribute lists
+        self._path_cache = {}
         del self.ifcs[idx]
         del self.gbl_tfrms[idx]
         del self.lcl_tfrms[idx]
@@ -343,6 +365,7 @@ class SequentialModel:
         part_tree = self.opt_model.part_tree
         ifcs = [n.id for n in part_tree.nodes_with_tag(tag='#ifc',
                                                        root=e_node)]
+        self._path_cache = {}
         for ifc in ifcs:
             idx = self.ifcs.index(ifc)
             if (self.stop_surface is not None and
@@ -433,6 +456,7 @@ class SequentialModel:
         spectral_region = self.opt_model['optical_spec'].spectral_region
         ref_wl = spectral_region.reference_wvl
 
+        self._path_cache = {}
         self.wvlns = spectral_region.wavelengths
         self.rndx = self.calc_ref_indices_for_spectrum(self.wvlns)
         n_before = self.rndx[0][ref_wl]
@@ -530,6 +554,7 @@ class SequentialModel:
 
     def update_reflections(self, start):
         """ update interfaces and gaps following insertion of a mirror """
+        self._path_cache = {}
 
         for i, sg in enumerate(self.path(start=start), start=start):
             ifc, g, lcl_tfrm, rndx, z_dir = sg
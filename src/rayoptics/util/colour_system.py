@@ -137,6 +137,24 @@ class ColourSystem:
         xyz = self.wvl_to_xyz(wv)
         return self.xyz_to_rgb(xyz, out_fmt)
 
+    def wvls_to_rgb(self, wvls):
+        """Convert an array of wavelengths (nm) to an array of rgb values.
+
+        The rgb values are looked up in a table of :meth:`wvl_to_rgb` results
+        on the colour-matching function grid. The table is built on first
+        use. Wavelengths outside of 380 - 780 nm use the end values.
+
+        """
+        rgb_lut = getattr(self, 'rgb_lut', None)
+        if rgb_lut is None:
+            rgb_lut = np.array([self.wvl_to_rgb(380.0 + 5.0*i)
+                                for i in range(len(self.cmf))])
+            self.rgb_lut = rgb_lut
+        wvls = np.asarray(wvls, dtype=np.float64)
+        index = np.clip(((wvls - 380.0)/5.0).astype(int),
+                        0, len(rgb_lut) - 1)
+        return rgb_lut[index]
+
     def relative_colorimetric_gamut_mapping(self, xyz):
         """ Apply relative colorimetric gamut mapping to XYZ and return RGB """
         xy_mapped = intersect_with_3lines(xyz[:2], self.white[:2],